@@ -9,18 +9,82 @@ Each configured birthday instance creates:
 - A sensor showing the person's age.
 - A calendar with all birthdays.
 
-Configuration is handled via the UI (Config Flow).
+Configuration is handled via the UI (Config Flow). The `birthdays.remove`
+service removes or archives many birthdays in one batch, and
+`birthdays.get_upcoming` returns the birthdays in the coming days.
+
+By default each person gets their own device. The device option in the
+config and options flow puts a person's entities on a shared "Birthdays" hub
+device or on a device for their group instead.
 """
 
 import logging
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
+import homeassistant.util.dt as dt_util
+from homeassistant.config_entries import ConfigEntry, ConfigEntryDisabler
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from homeassistant.exceptions import HomeAssistantError
 from .const import *
+from .store import BirthdayStore
+from .util import async_cleanup_devices, async_device_info, async_get_log_summary
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_REMOVE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(ATTR_NAMES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_ENTRY_IDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_GROUP): cv.string,
+        vol.Optional(ATTR_ARCHIVE, default=False): cv.boolean,
+    }),
+    cv.has_at_least_one_key(ATTR_NAMES, ATTR_ENTRY_IDS, ATTR_GROUP),
+)
+
+SERVICE_GET_UPCOMING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DAYS, default=DEFAULT_UPCOMING_DAYS): vol.All(vol.Coerce(int), vol.Range(min=1, max=366)),
+    vol.Optional(ATTR_GROUP): cv.string,
+    vol.Optional(ATTR_MIN_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_MAX_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1)),
+})
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the shared store and register the Birthdays services.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        config (dict): The Home Assistant configuration.
+
+    Returns:
+        bool: True if setup is successful.
+    """
+
+    async def _async_handle_remove(call: ServiceCall):
+        """Handle the remove service call."""
+        await _async_bulk_remove(hass, call.data)
+
+    @callback
+    def _handle_get_upcoming(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_upcoming service call."""
+        return _get_upcoming(hass, call.data)
+
+    hass.data[DATA_STORE] = BirthdayStore()
+    hass.services.async_register(DOMAIN, SERVICE_REMOVE, _async_handle_remove, schema=SERVICE_REMOVE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_UPCOMING,
+        _handle_get_upcoming,
+        schema=SERVICE_GET_UPCOMING_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Birthdays integration from a config entry.
 
@@ -33,11 +97,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     _LOGGER.debug("Setting up Birthdays integration for entry: %s", entry.entry_id)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry.data
+    index = None
+    try:
+        index = hass.data[DATA_STORE].add(
+            entry.entry_id,
+            entry.data[CONF_NAME],
+            entry.data[CONF_YEAR],
+            entry.data[CONF_MONTH],
+            entry.data[CONF_DAY],
+            entry.data.get(CONF_GROUP),
+        )
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = index
+    except (KeyError, ValueError, TypeError) as e:
+        _LOGGER.error("Entry is missing required or valid data fields: %s (%s)", entry.entry_id, e)
 
     try:
         await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "binary_sensor", "calendar"])
-        _LOGGER.info("Birthdays integration setup complete for entry: %s", entry.entry_id)
+        if index is not None:
+            async_cleanup_devices(hass, entry, async_device_info(entry.entry_id, entry.data))
+        _LOGGER.debug("Birthdays integration setup complete for entry: %s", entry.entry_id)
+        async_get_log_summary(hass).record("set up" if index is not None else "skipped")
     except HomeAssistantError as e:
         _LOGGER.error("Failed to set up Birthdays entry %s: %s", entry.entry_id, str(e))
         return False
@@ -64,16 +143,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
         hass.data[DOMAIN].pop(entry.entry_id)
-        _LOGGER.info("Removed entry data for: %s", entry.entry_id)
+        _LOGGER.debug("Removed entry data for: %s", entry.entry_id)
 
-    remaining_entries = [e for e in hass.config_entries.async_entries(DOMAIN) if e.entry_id != entry.entry_id]
+    # Free the store row only once no entity of this entry uses it any more
+    if success and hass.data[DATA_STORE].remove(entry.entry_id) and not hass.data.get(DATA_BULK_REMOVAL):
+        calendar = hass.data.get(DOMAIN, {}).get(CALENDAR_ENTITY_ID)
+        if calendar is not None:
+            calendar.refresh()
+
+    if _bulk_removal_pending(hass, entry):
+        remaining_entries = True
+    else:
+        remaining_entries = [e for e in hass.config_entries.async_entries(DOMAIN) if e.entry_id != entry.entry_id]
 
     if not remaining_entries:
         _LOGGER.info("Last birthday instance removed. Removing calendar...")
         await hass.config_entries.async_unload_platforms(entry, ["calendar"])
         await _remove_calendar_entity(hass)
 
-    _LOGGER.info("Successfully unloaded Birthdays integration for entry: %s", entry.entry_id)
+    _LOGGER.debug("Successfully unloaded Birthdays integration for entry: %s", entry.entry_id)
+    async_get_log_summary(hass).record("unloaded")
     return success
 
 
@@ -86,7 +175,10 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
     """
     _LOGGER.debug("Removing Birthdays integration entry: %s", entry.entry_id)
 
-    remaining_entries = [ent for ent in hass.config_entries.async_entries(DOMAIN) if ent.entry_id != entry.entry_id]
+    if _bulk_removal_pending(hass, entry):
+        remaining_entries = True
+    else:
+        remaining_entries = [ent for ent in hass.config_entries.async_entries(DOMAIN) if ent.entry_id != entry.entry_id]
 
     if not remaining_entries:
         _LOGGER.info("Last birthday removed. Removing Birthdays calendar entity.")
@@ -96,7 +188,8 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
         hass.data.pop(DOMAIN)
         _LOGGER.info("All Birthdays data removed from Home Assistant.")
 
-    _LOGGER.info("Cleanup complete for Birthdays integration entry: %s", entry.entry_id)
+    _LOGGER.debug("Cleanup complete for Birthdays integration entry: %s", entry.entry_id)
+    async_get_log_summary(hass).record("removed")
 
 
 async def _remove_calendar_entity(hass: HomeAssistant):
@@ -118,3 +211,106 @@ async def _remove_calendar_entity(hass: HomeAssistant):
         _LOGGER.error("Failed to remove Birthdays calendar entity: %s", str(e))
     except Exception as e:
         _LOGGER.exception("Unexpected error while removing Birthdays calendar entity: %s", str(e))
+
+
+def _bulk_removal_pending(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Return True if other entries of a bulk removal are still to be processed.
+
+    While a bulk removal is running, the per-entry check for remaining entries
+    is skipped. The last entry of the batch performs it once.
+    """
+    pending = hass.data.get(DATA_BULK_REMOVAL)
+    return bool(pending) and not (len(pending) == 1 and entry.entry_id in pending)
+
+
+async def _async_bulk_remove(hass: HomeAssistant, data: dict):
+    """Remove or archive all birthdays matching the service call filters.
+
+    Entries are still removed or disabled one at a time. What is batched is
+    the per-entry work around it: the check for remaining entries runs only
+    for the last entry and the calendar is refreshed once at the end.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        data (dict): The validated service call data.
+    """
+    names = {name.strip().lower() for name in data.get(ATTR_NAMES, [])}
+    entry_ids = set(data.get(ATTR_ENTRY_IDS, []))
+    group = data.get(ATTR_GROUP, "").strip().lower()
+    archive = data[ATTR_ARCHIVE]
+
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in entry_ids
+        or entry.data.get(CONF_NAME, "").strip().lower() in names
+        or (group and (entry.data.get(CONF_GROUP) or "").strip().lower() == group)
+    ]
+
+    if not entries:
+        _LOGGER.warning("No birthdays matched the remove service call: %s", data)
+        return
+
+    pending = hass.data.setdefault(DATA_BULK_REMOVAL, set())
+    pending.update(entry.entry_id for entry in entries)
+
+    for entry in entries:
+        try:
+            if archive:
+                await hass.config_entries.async_set_disabled_by(entry.entry_id, ConfigEntryDisabler.USER)
+            else:
+                await hass.config_entries.async_remove(entry.entry_id)
+        except HomeAssistantError as e:
+            _LOGGER.error("Failed to %s Birthdays entry %s: %s", "archive" if archive else "remove", entry.entry_id, str(e))
+        finally:
+            pending.discard(entry.entry_id)
+
+    # The store rows were freed by async_unload_entry, update the calendar once for the whole batch
+    calendar = hass.data.get(DOMAIN, {}).get(CALENDAR_ENTITY_ID)
+    if calendar is not None and hass.data[DATA_STORE]:
+        calendar.refresh()
+
+    _LOGGER.debug("Bulk %s finished for %d birthdays", "archive" if archive else "removal", len(entries))
+
+
+@callback
+def _get_upcoming(hass: HomeAssistant, data: dict) -> ServiceResponse:
+    """Return the birthdays in the coming days that match the service call filters.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        data (dict): The validated service call data.
+
+    Returns:
+        ServiceResponse: The matching birthdays, ordered by date.
+    """
+    store = hass.data[DATA_STORE]
+    today = dt_util.now().date()
+    group = data.get(ATTR_GROUP, "").strip().lower()
+    min_age = data.get(ATTR_MIN_AGE)
+    max_age = data.get(ATTR_MAX_AGE)
+    limit = data.get(ATTR_LIMIT)
+
+    birthdays = []
+    for index, birthday in store.upcoming(today, data[ATTR_DAYS]):
+        age = birthday.year - store.year(index)
+
+        if group and store.group(index).lower() != group:
+            continue
+        if (min_age is not None and age < min_age) or (max_age is not None and age > max_age):
+            continue
+
+        birthdays.append({
+            "entry_id": store.entry_id(index),
+            "name": store.name(index),
+            "group": store.group(index) or None,
+            "date": birthday.isoformat(),
+            "days": (birthday - today).days,
+            "age": age,
+            "birth_date": store.birth_date(index).isoformat(),
+        })
+
+        if limit is not None and len(birthdays) >= limit:
+            break
+
+    return {"birthdays": birthdays}
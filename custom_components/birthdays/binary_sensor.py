@@ -6,9 +6,9 @@ It returns `on` if the birth date matches the current day and month.
 
 import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.entity import DeviceInfo
 import homeassistant.util.dt as dt_util
 from .const import *
+from .util import async_device_info, log_rate_limited
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,63 +22,47 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """
     _LOGGER.debug("Setting up binary sensor for entry: %s", entry.entry_id)
 
-    config = entry.data
+    store = hass.data[DATA_STORE]
+    index = store.index(entry.entry_id)
 
     # Tjek om nødvendige data er til stede
-    required_keys = [CONF_NAME, CONF_YEAR, CONF_MONTH, CONF_DAY]
-    missing_keys = [key for key in required_keys if key not in config]
-
-    if missing_keys:
-        _LOGGER.error("Missing required data in entry %s: %s", entry.entry_id, ", ".join(missing_keys))
+    if index is None:
+        _LOGGER.error("Missing or invalid birthday data in entry %s", entry.entry_id)
         return
 
-    sensor = BirthdayBinarySensor(config, entry.entry_id)
+    sensor = BirthdayBinarySensor(store, index, async_device_info(entry.entry_id, entry.data))
     async_add_entities([sensor], True)  # True for at opdatere med det samme
 
-    _LOGGER.info("Binary sensor added for: %s", config.get(CONF_NAME, "Unknown"))
+    _LOGGER.debug("Binary sensor added for: %s", store.name(index))
 
 
 class BirthdayBinarySensor(BinarySensorEntity):
     """Binary sensor indicating if today is the birthday."""
 
     should_poll = False  # Home Assistant skal ikke poll'e denne sensor
+    _attr_icon = ICON_BINARY_SENSOR
 
-    def __init__(self, config, entry_id):
+    def __init__(self, store, index, device_info):
         """Initialize the binary sensor.
 
         Args:
-            config (dict): Configuration data containing name, day, and month.
-            entry_id (str): Unique ID of the integration instance.
+            store (BirthdayStore): Shared store holding the birthday data.
+            index (int): Row index of the person in the store.
+            device_info (DeviceInfo): Device the sensor belongs to.
         """
         super().__init__()
 
-        self._config = config
+        self._store = store
+        self._index = index
         self._state = None
 
-        # Tjek om nødvendige data er til stede
-        required_keys = [CONF_NAME, CONF_YEAR, CONF_MONTH, CONF_DAY]
-        missing_keys = [key for key in required_keys if key not in config]
-
-        if missing_keys:
-            _LOGGER.error("Missing required data in binary sensor configuration: %s", ", ".join(missing_keys))
-            self._attr_name = "Unknown Birthday Sensor"
-            self._attr_available = False
-            return
-
-        name = config[CONF_NAME]
+        name = store.name(index)
         name_slug = name.lower().replace(" ", "_")
 
         self._attr_name = f"Birthday: {name}"
-        self._attr_unique_id = f"{entry_id}_today"
+        self._attr_unique_id = f"{store.entry_id(index)}_today"
         self.entity_id = BINARY_SENSOR_NAME_TEMPLATE.format(name=name_slug)  # Tilføjet entity_id
-        self._attr_icon = ICON_BINARY_SENSOR
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=f"Birthday: {name}",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-        )
-        self._attr_available = True
+        self._attr_device_info = device_info
 
         _LOGGER.debug("Initialized BirthdayBinarySensor: %s (entity_id: %s)", self._attr_name, self.entity_id)
 
@@ -87,15 +71,15 @@ class BirthdayBinarySensor(BinarySensorEntity):
 
         Checks if today matches the configured birthday and updates the state.
         """
-        if not self._attr_available:
-            _LOGGER.warning("Skipping update for %s because it's not available", self._attr_name)
+        if not self.available:
+            log_rate_limited(self.hass, _LOGGER, logging.WARNING, "Skipping update for %s because it's not available", self.entity_id)
             return
 
         today = dt_util.now().date()
-        is_birthday = today.day == self._config[CONF_DAY] and today.month == self._config[CONF_MONTH]
+        is_birthday = self._store.next_birthday(self._index, today) == today
 
         if is_birthday != self._state:
-            _LOGGER.info("State change for %s: %s -> %s", self._attr_name, self._state, is_birthday)
+            _LOGGER.debug("State change for %s: %s -> %s", self._attr_name, self._state, is_birthday)
             self._state = is_birthday
 
             if self.hass:
@@ -109,4 +93,4 @@ class BirthdayBinarySensor(BinarySensorEntity):
     @property
     def available(self):
         """Return whether the sensor is available."""
-        return self._attr_available
+        return self._store.contains(self._index)
@@ -1,11 +1,10 @@
 """Calendar entity for the Birthdays integration."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 import homeassistant.util.dt as dt_util
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -14,40 +13,37 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     """Set up the calendar platform."""
     _LOGGER.debug("Setting up Birthdays Calendar entity.")
 
+    store = hass.data[DATA_STORE]
+
     if CALENDAR_ENTITY_ID not in hass.data.setdefault(DOMAIN, {}):
-        calendar = BirthdaysCalendar(hass)
+        calendar = BirthdaysCalendar(hass, store)
         hass.data[DOMAIN][CALENDAR_ENTITY_ID] = calendar
         async_add_entities([calendar])
         _LOGGER.info("Birthdays calendar entity added: %s", CALENDAR_ENTITY_ID)
-    else:
-        calendar = hass.data[DOMAIN][CALENDAR_ENTITY_ID]
-
-    try:
-        year = int(entry.data[CONF_YEAR])
-        month = int(entry.data[CONF_MONTH])
-        day = int(entry.data[CONF_DAY])
-        name = entry.data[CONF_NAME]
-
-        calendar.add_event(
-            entry_id=entry.entry_id,
-            name=name,
-            year=year,
-            month=month,
-            day=day,
-        )
-    except (KeyError, ValueError, TypeError) as e:
-        _LOGGER.error("Skipping event addition. Entry data missing or invalid: %s (%s)", entry.entry_id, e)
+
+    index = store.index(entry.entry_id)
+    if index is None:
+        _LOGGER.error("Skipping event addition. Entry data missing or invalid: %s", entry.entry_id)
+        return
+
+    # Events are built from the store on demand, only log the new birthday
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Added/updated birthday event: %s on %s", store.name(index), store.next_birthday(index, dt_util.now().date()))
 
 
 class BirthdaysCalendar(CalendarEntity):
-    """Calendar for Birthdays."""
+    """Calendar for Birthdays.
+
+    Events are not kept in memory. CalendarEvent objects are built from the
+    shared BirthdayStore only when the calendar is queried.
+    """
 
-    def __init__(self, hass):
+    def __init__(self, hass, store):
         """Initialize the calendar entity."""
         self.hass = hass
+        self._store = store
         self._attr_name = CALENDAR_NAME
         self._attr_unique_id = CALENDAR_ENTITY_ID
-        self._events = {}
 
         _LOGGER.debug("Initialized BirthdaysCalendar.")
 
@@ -59,30 +55,32 @@ class BirthdaysCalendar(CalendarEntity):
     @property
     def event(self):
         """Return the next upcoming birthday event."""
-        now = dt_util.now()
-        upcoming_events = [
-            event
-            for event_list in self._events.values()
-            for event in event_list
-            if isinstance(event, CalendarEvent) and event.start >= now
-        ]
-        return min(upcoming_events, key=lambda x: x.start) if upcoming_events else None
+        today = dt_util.now().date()
+
+        for index, birthday in self._store.upcoming(today, 366):
+            return self._build_event(index, birthday)
+        return None
 
     @property
     def extra_state_attributes(self):
-        """Return state attributes for the calendar entity."""
-        return {
-            "events": [
-                {
-                    "summary": event.summary,
-                    "start_time": event.start.isoformat(),
-                    "end_time": event.end.isoformat(),
-                }
-                for event_list in self._events.values()
-                for event in event_list
-                if isinstance(event, CalendarEvent)
-            ]
-        }
+        """Return the next CALENDAR_ATTRIBUTE_EVENTS birthdays as state attributes.
+
+        Use `birthdays.get_upcoming` or `calendar.get_events` for the full list.
+        """
+        today = dt_util.now().date()
+        events = []
+
+        for index, birthday in self._store.upcoming(today, 366):
+            start = dt_util.start_of_local_day(birthday)
+            events.append({
+                "summary": self._summary(index, birthday),
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(days=1) - timedelta(seconds=1)).isoformat(),
+            })
+            if len(events) >= CALENDAR_ATTRIBUTE_EVENTS:
+                break
+
+        return {"events": events}
 
     async def async_get_events(self, hass, start_date, end_date):
         """Return events within a specific time range."""
@@ -90,62 +88,31 @@ class BirthdaysCalendar(CalendarEntity):
 
         start_date = dt_util.as_utc(start_date)
         end_date = dt_util.as_utc(end_date)
+        years = range(dt_util.as_local(start_date).year, dt_util.as_local(end_date).year + 1)
+
+        events = []
+        for index in self._store:
+            for year in years:
+                event_start = dt_util.start_of_local_day(self._store.occurrence(index, year))
+                if start_date <= event_start <= end_date:
+                    events.append(self._build_event(index, event_start.date()))
+
+        return sorted(events, key=lambda event: event.start)
+
+    def refresh(self):
+        """Write the calendar state after birthdays changed."""
+        if self.hass and self.entity_id:
+            self.async_write_ha_state()
+
+    def _build_event(self, index, birthday):
+        """Build the CalendarEvent of a person's birthday on the given date."""
+        start = dt_util.start_of_local_day(birthday)
+        return CalendarEvent(
+            summary=self._summary(index, birthday),
+            start=start,
+            end=start + timedelta(days=1) - timedelta(seconds=1),
+        )
 
-        return [
-            {
-                "summary": event.summary,
-                "start_time": event.start.isoformat(),
-                "end_time": event.end.isoformat(),
-            }
-            for event_list in self._events.values()
-            for event in event_list
-            if isinstance(event, CalendarEvent) and start_date <= event.start <= end_date
-        ]
-
-    def add_event(self, entry_id, name, year, month, day):
-        """Add or update a birthday event in the calendar."""
-        now = dt_util.now().astimezone()
-        event_date = datetime(now.year, month, day, 0, 0, tzinfo=now.tzinfo)
-
-        if event_date < now:
-            event_date = datetime(now.year + 1, month, day, 0, 0, tzinfo=now.tzinfo)
-
-        age = event_date.year - year
-
-        try:
-            event = CalendarEvent(
-                summary=f"🎂 {name} turns {age}",
-                start=event_date,
-                end=event_date + timedelta(days=1) - timedelta(seconds=1),
-            )
-
-            if isinstance(event, CalendarEvent):
-                self._events[entry_id] = [event]
-                _LOGGER.info("Added/updated birthday event: %s (turning %d) on %s", name, age, event.start.strftime("%Y-%m-%d"))
-            else:
-                raise ValueError("Event creation failed")
-        except Exception as e:
-            _LOGGER.error("Failed to create CalendarEvent for %s: %s", name, e)
-
-    async def remove_event(self, hass, entry_id):
-        """Remove events related to a deleted birthday instance."""
-        if entry_id in self._events:
-            del self._events[entry_id]
-            _LOGGER.info("Removed birthday events for entry: %s", entry_id)
-        else:
-            _LOGGER.warning("Tried to remove non-existing event for entry: %s", entry_id)
-
-        if not self._events:
-            _LOGGER.info("All birthdays removed, removing Birthdays calendar.")
-            await self._remove_calendar(hass)
-
-    async def _remove_calendar(self, hass):
-        """Remove the Birthdays calendar entity when the last birthday is deleted."""
-        entity_registry = async_get_entity_registry(hass)
-        calendar_entity = entity_registry.async_get(CALENDAR_ENTITY_ID)
-
-        if calendar_entity:
-            entity_registry.async_remove(calendar_entity.entity_id)
-            _LOGGER.info("Birthdays calendar entity removed.")
-        else:
-            _LOGGER.warning("Tried to remove non-existing Birthdays calendar entity.")
+    def _summary(self, index, birthday):
+        """Return the event summary of a person's birthday on the given date."""
+        return f"🎂 {self._store.name(index)} turns {birthday.year - self._store.year(index)}"
@@ -59,6 +59,7 @@ class BirthdaysConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             if not errors:
                 user_input[CONF_YEAR] = int(user_input[CONF_YEAR])  # Ensure it is stored as an integer
+                user_input[CONF_GROUP] = user_input.get(CONF_GROUP, "").strip()
                 return self.async_create_entry(title=name, data=user_input)
 
         # Vis UI-formular til at indtaste fødselar
@@ -69,6 +70,8 @@ class BirthdaysConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_YEAR): str,  # Tekstfelt til årstal
                 vol.Required(CONF_MONTH, default=1): vol.In(range(1, 13)),  # Dropdown
                 vol.Required(CONF_DAY, default=1): vol.In(range(1, 32)),  # Dropdown
+                vol.Optional(CONF_GROUP, default=""): str,  # Valgfri gruppe
+                vol.Required(CONF_DEVICE_MODE, default=DEVICE_MODE_PERSON): vol.In(DEVICE_MODES),  # Dropdown
             }),
             errors=errors
         )
@@ -117,7 +120,16 @@ class BirthdaysOptionsFlowHandler(config_entries.OptionsFlow):
 
             if not errors:
                 user_input[CONF_YEAR] = int(user_input[CONF_YEAR])  # Ensure it is stored as an integer
-                return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+                user_input[CONF_GROUP] = user_input.get(CONF_GROUP, "").strip()
+
+                # Gem ændringerne i entry.data, som resten af integrationen læser, og genindlæs
+                self.hass.config_entries.async_update_entry(
+                    self._config_entry,
+                    title=user_input[CONF_NAME],
+                    data={**self._config_entry.data, **user_input},
+                )
+                self.hass.config_entries.async_schedule_reload(self._config_entry.entry_id)
+                return self.async_create_entry(title="", data={})
 
         # Hent de nuværende værdier fra config_entry
         current_config = self._config_entry.data
@@ -129,6 +141,8 @@ class BirthdaysOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(CONF_YEAR, default=str(current_config.get(CONF_YEAR, ""))): str,  # Tekstfelt til årstal
                 vol.Required(CONF_MONTH, default=current_config.get(CONF_MONTH, 1)): vol.In(range(1, 13)),
                 vol.Required(CONF_DAY, default=current_config.get(CONF_DAY, 1)): vol.In(range(1, 32)),
+                vol.Optional(CONF_GROUP, default=current_config.get(CONF_GROUP, "")): str,
+                vol.Required(CONF_DEVICE_MODE, default=current_config.get(CONF_DEVICE_MODE, DEVICE_MODE_PERSON)): vol.In(DEVICE_MODES),
             }),
             errors=errors
                 )
@@ -11,10 +11,12 @@ CONF_NAME = "name"      # Name of the person
 CONF_YEAR = "year"      # Year of birth
 CONF_MONTH = "month"    # Month of birth
 CONF_DAY = "day"        # Day of birth
+CONF_GROUP = "group"    # Optional group the person belongs to
 
 # Default calendar details
 CALENDAR_NAME = "Birthdays"                 # Default name for the calendar
 CALENDAR_ENTITY_ID = "calendar.birthdays"   # Fixed Entity ID for the calendar
+CALENDAR_ATTRIBUTE_EVENTS = 10              # Upcoming birthdays listed in the calendar's attributes
 
 # Sensor and binary sensor entity name templates
 SENSOR_NAME_TEMPLATE = "sensor.birthdays_{name}_{sensor_type}"
@@ -22,6 +24,16 @@ BINARY_SENSOR_NAME_TEMPLATE = "binary_sensor.birthdays_{name}_today"
 
 # Device identifiers
 DEVICE_ID_TEMPLATE = "birthdays_{name}"
+HUB_DEVICE_ID = "hub"                       # Identifier of the shared "Birthdays" device
+HUB_DEVICE_NAME = "Birthdays"
+GROUP_DEVICE_ID_TEMPLATE = "group_{group}"  # Identifier of a per-group device
+
+# Device modes, chosen per person in the config and options flow
+CONF_DEVICE_MODE = "device_mode"
+DEVICE_MODE_PERSON = "person"   # One device per person (default)
+DEVICE_MODE_HUB = "hub"         # All people under one "Birthdays" device
+DEVICE_MODE_GROUP = "group"     # One device per group, people without a group go to the hub
+DEVICE_MODES = [DEVICE_MODE_PERSON, DEVICE_MODE_HUB, DEVICE_MODE_GROUP]
 
 # Manufacturer & Model
 MANUFACTURER = "UnoSite"
@@ -46,3 +58,23 @@ LOG_ENTRY_MISSING_DATA = "Entry is missing required data fields: %s"
 LOG_SENSOR_UPDATE = "Updating sensor for %s"
 LOG_INVALID_DATE = "Invalid date provided: %s-%s-%s"
 LOG_DUPLICATE_ENTRY = "Duplicate entry detected: %s"
+
+# Services
+SERVICE_REMOVE = "remove"           # Remove or archive many birthdays at once
+ATTR_NAMES = "names"                # Names of the people to remove
+ATTR_ENTRY_IDS = "entry_ids"        # Config entry IDs of the people to remove
+ATTR_GROUP = "group"                # Group of the people to remove
+ATTR_ARCHIVE = "archive"            # Disable the entries instead of deleting them
+SERVICE_GET_UPCOMING = "get_upcoming"  # Return upcoming birthdays
+ATTR_DAYS = "days"                  # Number of days to look ahead
+ATTR_MIN_AGE = "min_age"            # Only birthdays turning at least this age
+ATTR_MAX_AGE = "max_age"            # Only birthdays turning at most this age
+ATTR_LIMIT = "limit"                # Maximum number of birthdays to return
+DEFAULT_UPCOMING_DAYS = 14
+DATA_STORE = "birthdays_store"      # hass.data key for the shared BirthdayStore
+DATA_BULK_REMOVAL = "birthdays_bulk_removal"  # hass.data key for entries pending bulk removal
+
+# Summary logging
+DATA_LOG_SUMMARY = "birthdays_log_summary"  # hass.data key for the batch log summary
+LOG_SUMMARY_DELAY = 2                       # Seconds of quiet before a batch summary is logged
+LOG_RATE_LIMIT_SECONDS = 300                # Minimum seconds between repeated warnings
@@ -2,116 +2,97 @@
 
 import logging
 import homeassistant.util.dt as dt_util
-from homeassistant.helpers.entity import Entity, DeviceInfo
+from homeassistant.helpers.entity import Entity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from .const import *
+from .util import async_device_info, log_rate_limited
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor type -> (friendly name, icon)
+SENSOR_TYPES = {
+    "next": ("Next birthday in", ICON_NEXT_BIRTHDAY),
+    "date": ("Date of birth", ICON_DATE_OF_BIRTH),
+    "years": ("Number of years", ICON_YEARS_OLD),
+}
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the sensor platform."""
-    config = entry.data
+    store = hass.data[DATA_STORE]
+    index = store.index(entry.entry_id)
 
     # Tjek om nødvendige data er til stede
-    required_keys = [CONF_NAME, CONF_YEAR, CONF_MONTH, CONF_DAY]
-    missing_keys = [key for key in required_keys if key not in config]
-
-    if missing_keys:
-        _LOGGER.error("Missing required data in entry %s: %s", entry.entry_id, ", ".join(missing_keys))
+    if index is None:
+        _LOGGER.error("Missing or invalid birthday data in entry %s", entry.entry_id)
         return
 
-    name_slug = config[CONF_NAME].lower().replace(" ", "_")
-    entry_id = entry.entry_id
+    name_slug = store.name(index).lower().replace(" ", "_")
+    device_info = async_device_info(entry.entry_id, entry.data)
 
     _LOGGER.debug("Setting up Birthday sensors for: %s", name_slug)
 
     async_add_entities([
-        BirthdaySensor(config, entry_id, "next", "Next birthday in", ICON_NEXT_BIRTHDAY),
-        BirthdaySensor(config, entry_id, "date", "Date of birth", ICON_DATE_OF_BIRTH),
-        BirthdaySensor(config, entry_id, "years", "Number of years", ICON_YEARS_OLD),
+        BirthdaySensor(store, index, sensor_type, device_info)
+        for sensor_type in SENSOR_TYPES
     ], True)
 
-    _LOGGER.info("Birthday sensors created for: %s", name_slug)
+    _LOGGER.debug("Birthday sensors created for: %s", name_slug)
 
 
 class BirthdaySensor(Entity):
-    """Representation of a Birthday Sensor."""
+    """Representation of a Birthday Sensor.
+
+    The sensor reads the birthday from its row in the shared BirthdayStore.
+    """
 
     should_poll = False  # Home Assistant skal ikke poll'e denne sensor
 
-    def __init__(self, config, entry_id, sensor_type, friendly_name, icon):
+    def __init__(self, store, index, sensor_type, device_info):
         """Initialize the sensor."""
         super().__init__()
 
-        self._config = config
+        self._store = store
+        self._index = index
         self._sensor_type = sensor_type
         self._attr_native_value = None
 
-        # Tjek om nødvendige data er til stede
-        required_keys = [CONF_NAME, CONF_YEAR, CONF_MONTH, CONF_DAY]
-        missing_keys = [key for key in required_keys if key not in config]
-
-        if missing_keys:
-            _LOGGER.error("Missing required data in sensor configuration: %s", ", ".join(missing_keys))
-            self._attr_name = "Unknown Birthday Sensor"
-            self._attr_available = False
-            return
-
-        name = config[CONF_NAME]
+        name = store.name(index)
         name_slug = name.lower().replace(" ", "_")
+        friendly_name, icon = SENSOR_TYPES[sensor_type]
 
         self._attr_name = f"Birthday: {name} - {friendly_name}"
-        self._attr_unique_id = f"{entry_id}_{sensor_type}"
+        self._attr_unique_id = f"{store.entry_id(index)}_{sensor_type}"
         self.entity_id = SENSOR_NAME_TEMPLATE.format(name=name_slug, sensor_type=sensor_type)  # Tilføjet entity_id
         self._attr_icon = icon
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=f"Birthday: {name}",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-        )
-        self._attr_available = True
+        self._attr_device_info = device_info
 
         _LOGGER.debug("Initialized BirthdaySensor: %s (entity_id: %s)", self._attr_name, self.entity_id)
 
     async def async_update(self):
         """Update sensor state."""
-        if not self._attr_available:
-            _LOGGER.warning("Skipping update for %s because it's not available", self._attr_name)
+        if not self.available:
+            log_rate_limited(self.hass, _LOGGER, logging.WARNING, "Skipping update for %s because it's not available", self.entity_id)
             return
 
         today = dt_util.now().date()
-
-        try:
-            birth_date = dt_util.parse_datetime(
-                f"{self._config[CONF_YEAR]}-{self._config[CONF_MONTH]:02d}-{self._config[CONF_DAY]:02d}T00:00:00Z"
-            ).date()
-        except ValueError as e:
-            _LOGGER.error("Error parsing birth date for %s: %s", self._attr_name, e)
-            return
+        store, index = self._store, self._index
 
         new_value = None
 
         if self._sensor_type == "next":
-            next_birthday = birth_date.replace(year=today.year)
-            if next_birthday < today:
-                next_birthday = next_birthday.replace(year=today.year + 1)
-            new_value = (next_birthday - today).days
-            _LOGGER.debug("Next birthday for %s in %d days", self._config[CONF_NAME], new_value)
+            new_value = (store.next_birthday(index, today) - today).days
+            _LOGGER.debug("Next birthday for %s in %d days", store.name(index), new_value)
 
         elif self._sensor_type == "date":
-            new_value = birth_date.strftime("%Y-%m-%d")
+            new_value = store.birth_date(index).strftime("%Y-%m-%d")
 
         elif self._sensor_type == "years":
-            age = today.year - birth_date.year
-            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                age -= 1
-            new_value = age
-            _LOGGER.debug("%s is %d years old", self._config[CONF_NAME], new_value)
+            new_value = store.age(index, today)
+            _LOGGER.debug("%s is %d years old", store.name(index), new_value)
 
         if new_value != self._attr_native_value:
-            _LOGGER.info("Updating %s: %s -> %s", self._attr_name, self._attr_native_value, new_value)
+            _LOGGER.debug("Updating %s: %s -> %s", self._attr_name, self._attr_native_value, new_value)
             self._attr_native_value = new_value
 
             if self.hass:
@@ -120,4 +101,4 @@ class BirthdaySensor(Entity):
     @property
     def available(self):
         """Return whether the sensor is available."""
-        return self._attr_available
+        return self._store.contains(self._index)
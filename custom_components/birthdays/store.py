@@ -0,0 +1,217 @@
+"""Compact in-memory store of all configured birthdays.
+
+Every person is a row in a set of parallel `array` columns. Names and groups
+are interned, so entities and the calendar only keep a row index instead of
+their own copy of the configuration. A day-of-year index answers "who has a
+birthday in the next N days" without scanning everyone.
+"""
+
+import calendar
+import sys
+from array import array
+from datetime import date, timedelta
+
+# Group index used for people without a group
+NO_GROUP = 0
+
+
+def _day_key(month, day):
+    """Return the key of a month and day in the day index."""
+    return month * 32 + day
+
+
+# Key of 29 February, which is celebrated on the 28th in non-leap years
+LEAP_DAY_KEY = _day_key(2, 29)
+
+
+class BirthdayStore:
+    """Column-oriented store of birthdays, addressed by row index."""
+
+    __slots__ = (
+        "_entry_ids",
+        "_names",
+        "_years",
+        "_months",
+        "_days",
+        "_groups",
+        "_group_names",
+        "_group_index",
+        "_rows",
+        "_free",
+        "_by_day",
+    )
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._entry_ids = []            # Config entry ID per row, None for free rows
+        self._names = []                # Interned name per row
+        self._years = array("H")        # Year of birth
+        self._months = array("B")       # Month of birth
+        self._days = array("B")         # Day of birth
+        self._groups = array("H")       # Index into self._group_names
+        self._group_names = [""]        # Interned group names, NO_GROUP first
+        self._group_index = {"": NO_GROUP}
+        self._rows = {}                 # Config entry ID -> row index
+        self._free = []                 # Rows that can be reused
+        self._by_day = {}               # Day key -> rows with a birthday on that day
+
+    def __len__(self):
+        """Return the number of people in the store."""
+        return len(self._rows)
+
+    def __iter__(self):
+        """Iterate over the row indexes of all people."""
+        return iter(self._rows.values())
+
+    def add(self, entry_id, name, year, month, day, group=None):
+        """Add or update a person and return their row index.
+
+        Raises:
+            ValueError: If the date of birth is invalid.
+        """
+        year, month, day = int(year), int(month), int(day)
+        date(year, month, day)  # Validate the date
+
+        name = sys.intern(str(name))
+        group_id = self._group_id((group or "").strip())
+
+        row = self._rows.get(entry_id)
+        if row is None:
+            row = self._free.pop() if self._free else None
+        else:
+            self._unindex_day(row)
+
+        if row is None:
+            row = len(self._entry_ids)
+            self._entry_ids.append(entry_id)
+            self._names.append(name)
+            self._years.append(year)
+            self._months.append(month)
+            self._days.append(day)
+            self._groups.append(group_id)
+        else:
+            self._entry_ids[row] = entry_id
+            self._names[row] = name
+            self._years[row] = year
+            self._months[row] = month
+            self._days[row] = day
+            self._groups[row] = group_id
+
+        self._rows[entry_id] = row
+        self._by_day.setdefault(_day_key(month, day), []).append(row)
+        return row
+
+    def remove(self, entry_id):
+        """Remove a person and free their row. Returns True if they were in the store.
+
+        Only call this once no entity uses the row any more, as the row is
+        reused by the next `add`.
+        """
+        row = self._rows.pop(entry_id, None)
+        if row is None:
+            return False
+
+        self._unindex_day(row)
+        self._entry_ids[row] = None
+        self._names[row] = None
+        self._free.append(row)
+        return True
+
+    def index(self, entry_id):
+        """Return the row index of a config entry, or None if unknown."""
+        return self._rows.get(entry_id)
+
+    def contains(self, row):
+        """Return whether a row index refers to a person."""
+        return 0 <= row < len(self._entry_ids) and self._entry_ids[row] is not None
+
+    def entry_id(self, row):
+        """Return the config entry ID of a row."""
+        return self._entry_ids[row]
+
+    def name(self, row):
+        """Return the name of a row."""
+        return self._names[row]
+
+    def year(self, row):
+        """Return the year of birth of a row."""
+        return self._years[row]
+
+    def month(self, row):
+        """Return the month of birth of a row."""
+        return self._months[row]
+
+    def day(self, row):
+        """Return the day of birth of a row."""
+        return self._days[row]
+
+    def group(self, row):
+        """Return the group of a row, or an empty string."""
+        return self._group_names[self._groups[row]]
+
+    def birth_date(self, row):
+        """Return the date of birth of a row."""
+        return date(self._years[row], self._months[row], self._days[row])
+
+    def occurrence(self, row, year):
+        """Return the birthday of a row in the given year.
+
+        People born on 29 February celebrate on the 28th in non-leap years.
+        """
+        month, day = self._months[row], self._days[row]
+        if month == 2 and day == 29 and not calendar.isleap(year):
+            day = 28
+        return date(year, month, day)
+
+    def next_birthday(self, row, today):
+        """Return the next birthday of a row on or after today."""
+        birthday = self.occurrence(row, today.year)
+        if birthday < today:
+            birthday = self.occurrence(row, today.year + 1)
+        return birthday
+
+    def age(self, row, today):
+        """Return the age of a row on the given day."""
+        age = today.year - self._years[row]
+        if self.occurrence(row, today.year) > today:
+            age -= 1
+        return age
+
+    def upcoming(self, today, days):
+        """Yield (row, birthday) for all birthdays in the `days` days starting today.
+
+        Results are ordered by date. Only the days in the window are looked
+        up, so the cost depends on the window and the number of results.
+        Every person is returned at most once, even if the window reaches
+        the same date next year.
+        """
+        seen = set()
+
+        for offset in range(days):
+            day = today + timedelta(days=offset)
+            rows = self._by_day.get(_day_key(day.month, day.day), ())
+
+            if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+                rows = [*rows, *self._by_day.get(LEAP_DAY_KEY, ())]
+
+            for row in rows:
+                if row not in seen:
+                    seen.add(row)
+                    yield row, day
+
+    def _unindex_day(self, row):
+        """Remove a row from the day index."""
+        key = _day_key(self._months[row], self._days[row])
+        rows = self._by_day[key]
+        rows.remove(row)
+        if not rows:
+            del self._by_day[key]
+
+    def _group_id(self, group):
+        """Return the index of an interned group name, adding it if needed."""
+        group_id = self._group_index.get(group)
+        if group_id is None:
+            group_id = len(self._group_names)
+            self._group_names.append(sys.intern(group))
+            self._group_index[group] = group_id
+        return group_id
@@ -0,0 +1,173 @@
+"""Shared helpers for the Birthdays integration.
+
+The device helpers place each person's entities on a per-person, per-group
+or shared hub device, depending on the person's device mode.
+
+Per-birthday messages are logged at DEBUG level. Batch operations such as
+setting up or removing many birthdays are reported as a single INFO line by
+`LogSummary`, and repeated warnings are rate limited by `log_rate_limited`.
+"""
+
+import logging
+import time
+from functools import partial
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import slugify
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rate limit state per message format string: [last logged, suppressed count, last args, timer]
+_rate_limited = {}
+
+
+@callback
+def log_rate_limited(hass: HomeAssistant, logger, level, msg, *args):
+    """Log a message at most once every LOG_RATE_LIMIT_SECONDS.
+
+    Messages are grouped by their format string, so the same warning for many
+    different birthdays is only written once per interval. Suppressed repeats
+    are reported in one line with their count when the interval ends.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance, used for the flush timer.
+        logger (logging.Logger): The logger to write to.
+        level (int): The logging level.
+        msg (str): The message format string.
+        *args: Arguments for the format string.
+    """
+    now = time.monotonic()
+    state = _rate_limited.get(msg)
+
+    if state is not None and now - state[0] < LOG_RATE_LIMIT_SECONDS:
+        state[1] += 1
+        state[2] = args
+        if state[3] is None:
+            state[3] = async_call_later(
+                hass,
+                LOG_RATE_LIMIT_SECONDS - (now - state[0]),
+                partial(_async_flush_rate_limited, logger, level, msg),
+            )
+        return
+
+    _rate_limited[msg] = [now, 0, args, None]
+    logger.log(level, msg, *args)
+
+
+@callback
+def _async_flush_rate_limited(logger, level, msg, _now):
+    """Log the suppressed repeats of a rate limited message."""
+    state = _rate_limited[msg]
+
+    if state[1]:
+        logger.log(level, msg + " (%d similar messages suppressed)", *state[2], state[1])
+
+    state[0] = time.monotonic()
+    state[1] = 0
+    state[3] = None
+
+
+class LogSummary:
+    """Collect per-birthday actions and log one summary line per batch."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the log summary."""
+        self.hass = hass
+        self._counts = {}
+        self._started = None
+        self._last = None
+        self._unsub = None
+
+    @callback
+    def record(self, action):
+        """Record one action, e.g. "set up" or "removed".
+
+        The summary is logged once no further actions have been recorded for
+        LOG_SUMMARY_DELAY seconds.
+        """
+        self._last = time.monotonic()
+        if self._started is None:
+            self._started = self._last
+
+        self._counts[action] = self._counts.get(action, 0) + 1
+
+        if self._unsub is not None:
+            self._unsub()
+        self._unsub = async_call_later(self.hass, LOG_SUMMARY_DELAY, self._async_flush)
+
+    @callback
+    def _async_flush(self, _now):
+        """Log the collected summary and reset the counters."""
+        elapsed = self._last - self._started
+
+        for action, count in self._counts.items():
+            _LOGGER.info("Birthdays: %s %s %s in %.1fs", action, f"{count:,}", "person" if count == 1 else "people", elapsed)
+
+        self._counts = {}
+        self._started = None
+        self._last = None
+        self._unsub = None
+
+
+@callback
+def async_get_log_summary(hass: HomeAssistant) -> LogSummary:
+    """Return the shared log summary, creating it if needed."""
+    if DATA_LOG_SUMMARY not in hass.data:
+        hass.data[DATA_LOG_SUMMARY] = LogSummary(hass)
+    return hass.data[DATA_LOG_SUMMARY]
+
+
+@callback
+def async_device_info(entry_id, config) -> DeviceInfo:
+    """Return the device a person's entities belong to.
+
+    Args:
+        entry_id (str): Unique ID of the integration instance.
+        config (dict): Configuration data of the person.
+
+    Returns:
+        DeviceInfo: The per-person, per-group or hub device.
+    """
+    device_mode = config.get(CONF_DEVICE_MODE, DEVICE_MODE_PERSON)
+    group = (config.get(CONF_GROUP) or "").strip()
+
+    if device_mode == DEVICE_MODE_GROUP and group:
+        return DeviceInfo(
+            identifiers={(DOMAIN, GROUP_DEVICE_ID_TEMPLATE.format(group=slugify(group)))},
+            name=f"Birthdays: {group}",
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+        )
+
+    if device_mode in (DEVICE_MODE_HUB, DEVICE_MODE_GROUP):
+        return DeviceInfo(
+            identifiers={(DOMAIN, HUB_DEVICE_ID)},
+            name=HUB_DEVICE_NAME,
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+        )
+
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name=f"Birthday: {config[CONF_NAME]}",
+        manufacturer=MANUFACTURER,
+        model=MODEL,
+    )
+
+
+@callback
+def async_cleanup_devices(hass: HomeAssistant, entry: ConfigEntry, device_info: DeviceInfo):
+    """Detach the entry from devices it no longer uses, e.g. after changing the device mode.
+
+    Devices left without config entries are removed by the device registry.
+    """
+    device_registry = dr.async_get(hass)
+
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if device.identifiers != device_info["identifiers"]:
+            _LOGGER.debug("Detaching entry %s from unused device %s", entry.entry_id, device.name)
+            device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)